@@ -9,18 +9,34 @@ Part 1/4: Infrastructure & Foundations
 """
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from anyio import to_thread
 from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 import gspread
+from gspread.exceptions import GSpreadException
+from gspread.utils import numericise_all
+import numpy as np
+from numba import njit
+import orjson
 
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Tuple
 import os
+import sys
 import json
+import asyncio
 import time
 import threading
 import logging
-from datetime import datetime, timedelta
-from jose import jwt, JWTError
+from types import MappingProxyType
+from collections import Counter
+from functools import lru_cache
+from contextlib import asynccontextmanager, contextmanager
+from datetime import timedelta
+import jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -40,6 +56,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 APP_NAME = "EMPIRIA Intelligence API"
 APP_VERSION = "3.0.0"
 ENV = os.getenv("ENV", "production")
+THREADPOOL_WORKERS = int(os.getenv("THREADPOOL_WORKERS", "100"))
 
 # ==========================================================
 # LOGGING (structured, production-safe)
@@ -76,89 +93,264 @@ GOOGLE_SCOPES = [
 # THREAD-SAFE GOOGLE SHEETS CLIENT
 # ==========================================================
 
-_SHEET_LOCK = threading.Lock()
+class RWLock:
+    """
+    Readers-writer lock.
+    - Concurrent sheet reads proceed in parallel
+    - Writes (append_row) get exclusive access
+    - Waiting writers block new readers, so writes are not starved
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+_SHEET_LOCK = RWLock()
+
+@lru_cache(maxsize=1)
+def _client() -> gspread.Client:
+    """
+    Parse the service-account JSON and authorize once per process.
+    The session keeps a pooled HTTPS adapter so Sheets calls reuse
+    warm TLS connections instead of handshaking on every refresh.
+    """
+    creds_info = json.loads(os.environ["GOOGLE_CREDS_JSON"])
+    creds = Credentials.from_service_account_info(
+        creds_info,
+        scopes=GOOGLE_SCOPES,
+    )
+    session = AuthorizedSession(creds)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return gspread.authorize(creds, session=session)
 
-def init_google_sheets():
+@lru_cache(maxsize=1)
+def get_spreadsheet() -> gspread.Spreadsheet:
     """
     Single responsibility:
     - Validate credentials
     - Connect to Google Sheets
-    - Return worksheet handles
+    - Return the spreadsheet handle
+    Lazy and memoized: the OAuth exchange and open() run once per
+    process on first use, not at import. Failures are retried next call.
     """
     try:
-        creds_info = json.loads(os.environ["GOOGLE_CREDS_JSON"])
-
-        creds = Credentials.from_service_account_info(
-            creds_info,
-            scopes=GOOGLE_SCOPES,
-        )
-        client = gspread.authorize(creds)
-        book = client.open(SHEET_NAME)
-
-        students_ws = book.worksheet("students")
-        skills_ws = book.worksheet("skills")
-        outcomes_ws = book.worksheet("outcomes")
+        book = _client().open(SHEET_NAME)
 
         logger.info("Google Sheets connected successfully")
-        return students_ws, skills_ws, outcomes_ws
+        return book
 
     except Exception as e:
         logger.critical(f"Google Sheets initialization failed: {e}")
         raise
 
-students_sheet, skills_sheet, outcomes_sheet = init_google_sheets()
+@lru_cache(maxsize=1)
+def get_outcomes_worksheet() -> gspread.Worksheet:
+    return get_spreadsheet().worksheet("outcomes")
+
+SHEET_TABS = ("students", "skills", "outcomes", "users")
+
+def _values_to_records(values: List[List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Header row -> list of dicts, same transform as get_all_records(),
+    including its refusal of duplicate headers.
+    """
+    if not values:
+        return []
+
+    headers, rows = values[0], values[1:]
+    duplicates = [h for h, n in Counter(headers).items() if n > 1]
+    if duplicates:
+        raise GSpreadException(
+            f"the header row in the worksheet contains duplicates: {duplicates}"
+        )
+    width = len(headers)
+    return [
+        dict(zip(headers, numericise_all(row + [""] * (width - len(row)))))
+        for row in rows
+    ]
 
-def safe_sheet_fetch(ws) -> List[Dict[str, Any]]:
+def safe_batch_fetch(tabs: Tuple[str, ...]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Thread-safe sheet read.
+    Thread-safe read of several tabs in one values.batchGet round-trip.
     Prevents race conditions under concurrent API load.
     """
-    with _SHEET_LOCK:
-        return ws.get_all_records()
-def get_users_data():
-    with _SHEET_LOCK:
-        return students_sheet.spreadsheet.worksheet("users").get_all_records()
+    with _SHEET_LOCK.read():
+        resp = get_spreadsheet().values_batch_get(list(tabs))
+
+    return {
+        tab: _values_to_records(block.get("values", []))
+        for tab, block in zip(tabs, resp.get("valueRanges", []))
+    }
 
 # ==========================================================
-# TTL CACHE (NO MEMORY LEAK, NO STALE DATA)
+# TTL CACHE (STALE-WHILE-REVALIDATE, NO MEMORY LEAK)
 # ==========================================================
 
 class TTLCache:
     """
-    Deterministic TTL cache.
+    Deterministic TTL cache (stale-while-revalidate).
     - No unbounded growth
-    - Auto-refresh
-    - Thread-safe reads
+    - Only the cold load blocks; expired data is served while
+      a single background thread refreshes it (no stampede)
+    - Thread-safe reads, one lock per cache
     """
 
     def __init__(self, ttl_seconds: int):
         self.ttl = ttl_seconds
         self._data = None
         self._timestamp = 0.0
+        self._refreshing = False
         self._lock = threading.Lock()
 
+    def _refresh(self, loader: Callable[[], Any]) -> None:
+        try:
+            data = loader()
+        except Exception:
+            logger.exception("Background cache refresh failed; serving stale data")
+            with self._lock:
+                self._timestamp = time.time()
+                self._refreshing = False
+            return
+
+        with self._lock:
+            self._data = data
+            self._timestamp = time.time()
+            self._refreshing = False
+
+    @property
+    def ready(self) -> bool:
+        return self._data is not None
+
+    def refresh(self, loader: Callable[[], Any]) -> None:
+        """
+        Eager reload, used by the background refresher.
+        Readers keep getting the old value until the new one is swapped in.
+        """
+        data = loader()
+        with self._lock:
+            self._data = data
+            self._timestamp = time.time()
+
     def get(self, loader: Callable[[], Any]):
         now = time.time()
         with self._lock:
-            if self._data is None or (now - self._timestamp) > self.ttl:
+            if self._data is None:
                 self._data = loader()
                 self._timestamp = now
-        return self._data
+            elif (now - self._timestamp) > self.ttl and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(
+                    target=self._refresh,
+                    args=(loader,),
+                    daemon=True,
+                ).start()
+            return self._data
 
 CACHE_TTL_SECONDS = 60
 
-students_cache = TTLCache(CACHE_TTL_SECONDS)
-skills_cache = TTLCache(CACHE_TTL_SECONDS)
-outcomes_cache = TTLCache(CACHE_TTL_SECONDS)
+# (cache, loader) pairs in dependency order; refreshed eagerly in the background.
+CACHE_REFRESH_PLAN: List[Tuple[TTLCache, Callable[[], Any]]] = []
+
+def refresh_all_caches() -> None:
+    for cache, loader in CACHE_REFRESH_PLAN:
+        cache.refresh(loader)
+
+def _cache_refresher_loop(stop: threading.Event) -> None:
+    """
+    Reloads every registered cache every TTL/2 so requests only ever
+    hit warm data. Lazy TTL refresh remains the fallback if this stalls.
+    """
+    while True:
+        try:
+            refresh_all_caches()
+        except Exception:
+            logger.exception("Background cache refresh failed")
+
+        if stop.wait(CACHE_TTL_SECONDS / 2):
+            return
+
+sheets_cache = TTLCache(CACHE_TTL_SECONDS)
+
+def _load_all_sheets() -> Dict[str, List[Dict[str, Any]]]:
+    return safe_batch_fetch(SHEET_TABS)
+
+CACHE_REFRESH_PLAN.append((sheets_cache, _load_all_sheets))
 
 def get_students_data() -> List[Dict[str, Any]]:
-    return students_cache.get(lambda: safe_sheet_fetch(students_sheet))
+    return sheets_cache.get(_load_all_sheets)["students"]
 
 def get_skills_data() -> List[Dict[str, Any]]:
-    return skills_cache.get(lambda: safe_sheet_fetch(skills_sheet))
+    return sheets_cache.get(_load_all_sheets)["skills"]
 
 def get_outcomes_data() -> List[Dict[str, Any]]:
-    return outcomes_cache.get(lambda: safe_sheet_fetch(outcomes_sheet))
+    return sheets_cache.get(_load_all_sheets)["outcomes"]
+
+def get_users_data() -> List[Dict[str, Any]]:
+    return sheets_cache.get(_load_all_sheets)["users"]
+
+users_cache = TTLCache(CACHE_TTL_SECONDS)
+
+def _build_users_index() -> Dict[str, Dict[str, Any]]:
+    return {str(u["username"]): u for u in reversed(get_users_data())}
+
+CACHE_REFRESH_PLAN.append((users_cache, _build_users_index))
+
+def get_users_index() -> Dict[str, Dict[str, Any]]:
+    """
+    username -> user row, for O(1) login lookups.
+    First row wins on duplicate usernames.
+    """
+    return users_cache.get(_build_users_index)
+
+_cold_loads: Dict[Callable[[], Any], "asyncio.Task[Any]"] = {}
+
+async def load_cached(cache: TTLCache, accessor: Callable[[], Any]) -> Any:
+    """
+    Cache accessor for async endpoints.
+    Warm hits run inline; only a cold load (blocking Sheets I/O)
+    is pushed to the threadpool so it never stalls the event loop.
+    Concurrent cold requests await one shared in-flight load.
+    """
+    if cache.ready:
+        return accessor()
+
+    task = _cold_loads.get(accessor)
+    if task is None:
+        task = asyncio.ensure_future(run_in_threadpool(accessor))
+        _cold_loads[accessor] = task
+        task.add_done_callback(lambda _: _cold_loads.pop(accessor, None))
+    return await asyncio.shield(task)
 
 # ==========================================================
 # NUMERIC SAFETY UTILITIES
@@ -183,6 +375,61 @@ def safe_float(value: Any, default: float = 0.0) -> float:
 def clamp(val: float, low: float, high: float) -> float:
     return max(low, min(high, val))
 
+@lru_cache(maxsize=1024, typed=True)
+def _norm(value: Any) -> str:
+    """
+    Normalized lookup key for sheet strings (cert types, sources).
+    The same handful of values repeat across rows, so this is cached.
+    """
+    return str(value).strip().lower()
+
+@lru_cache(maxsize=256, typed=True)
+def _branch_key(value: Any) -> str:
+    """
+    Interned lowercase branch, the key of BASE_ROADMAPS / SKILL_MAP.
+    A cohort has only a handful of branches, so every row shares one object.
+    """
+    return sys.intern(str(value).lower())
+
+# ==========================================================
+# COLUMNAR (SoA) STUDENT VIEW
+# ==========================================================
+
+_INT16_MIN, _INT16_MAX = np.iinfo(np.int16).min, np.iinfo(np.int16).max
+
+def _int16_column(values: List[int]) -> np.ndarray:
+    """
+    Packed int16 column; percentages fit easily, garbage is clamped.
+    Clamp the Python ints first: a cell like "1e30" overflows int64 too.
+    """
+    return np.fromiter(
+        (min(max(v, _INT16_MIN), _INT16_MAX) for v in values),
+        dtype=np.int16,
+        count=len(values),
+    )
+
+def students_soa(students: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Column-oriented view of the students sheet for vectorized engines.
+    Row i of every column belongs to records[i].
+    """
+    return {
+        "records": students,
+        "att": _int16_column([safe_int(s.get("attendance")) for s in students]),
+        "avg": _int16_column([safe_int(s.get("internal_avg")) for s in students]),
+        "cert_type": np.array(
+            [_norm(s.get("cert_type", "student_coordinator")) for s in students], dtype=object
+        ),
+        "cert_source": np.array(
+            [_norm(s.get("cert_source", "unknown")) for s in students], dtype=object
+        ),
+        "branch": np.array([s.get("branch", "") for s in students], dtype=object),
+        "branch_key": np.array(
+            [_branch_key(s.get("branch", "")) for s in students], dtype=object
+        ),
+        "name": np.array([s.get("name", "") for s in students], dtype=object),
+    }
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -191,24 +438,58 @@ def verify_password(plain, hashed):
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    ttl = (
+        expires_delta.total_seconds()
+        if expires_delta
+        else ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+    to_encode["exp"] = int(time.time() + ttl)
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+@lru_cache(maxsize=1024)
+def _decode_token(token: str) -> Dict[str, Any]:
+    """
+    Verified JWT payload, memoized per token string.
+    Callers must still check `exp`, since a cached hit skips verification.
+    """
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        payload = _decode_token(token)
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    if payload.get("exp", 0) <= time.time():
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return dict(payload)
+
 # ==========================================================
 # FASTAPI APP INITIALIZATION
 # ==========================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints share anyio's default limiter (40 threads);
+    # size it explicitly so bursts don't queue behind it.
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_WORKERS
+
+    stop = threading.Event()
+    refresher = threading.Thread(
+        target=_cache_refresher_loop,
+        args=(stop,),
+        name="cache-refresher",
+        daemon=True,
+    )
+    refresher.start()
+    yield
+    stop.set()
+
 app = FastAPI(
     title=APP_NAME,
     version=APP_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -219,14 +500,12 @@ app.add_middleware(
 )
 @app.post("/login")
 def login(form: OAuth2PasswordRequestForm = Depends()):
-    users = get_users_data()
-
-    user = next((u for u in users if u["username"] == form.username), None)
+    user = get_users_index().get(form.username)
     if not user or not verify_password(form.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = create_access_token({
-        "sub": user["username"],
+        "sub": str(user["username"]),
         "role": user["role"],
         "linked_student_id": user.get("linked_student_id")
     })
@@ -234,15 +513,16 @@ def login(form: OAuth2PasswordRequestForm = Depends()):
     return {"access_token": token, "token_type": "bearer"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """
     Infra health only.
     Business intelligence starts in later parts.
     """
+    students = await load_cached(sheets_cache, get_students_data)
     return {
         "status": "ok",
         "env": ENV,
-        "cached_students": len(get_students_data()),
+        "cached_students": len(students),
     }
 
 # ==========================================================
@@ -265,15 +545,15 @@ from typing import Dict, Any, Tuple, List
 # CERTIFICATE CREDIBILITY ENGINE
 # ==========================================================
 
-def certificate_credibility(cert_type: str, cert_source: str) -> Tuple[float, str]:
-    fake_sources = {"randomsite", "cheapcert", "telegram", "freepdf"}
-    premium_sources = {"google", "microsoft", "aws", "ibm", "nptel", "coursera"}
+FAKE_SOURCES = frozenset({"randomsite", "cheapcert", "telegram", "freepdf"})
+PREMIUM_SOURCES = frozenset({"google", "microsoft", "aws", "ibm", "nptel", "coursera"})
 
-    src = str(cert_source).strip().lower()
+def certificate_credibility(cert_type: str, cert_source: str) -> Tuple[float, str]:
+    src = _norm(cert_source)
 
-    if src in fake_sources:
+    if src in FAKE_SOURCES:
         return -0.4, "FAKE / ZERO VALUE"
-    if src in premium_sources:
+    if src in PREMIUM_SOURCES:
         return 1.0, "HIGH CREDIBILITY"
     return 0.4, "LOW CREDIBILITY"
 
@@ -281,46 +561,53 @@ def certificate_credibility(cert_type: str, cert_source: str) -> Tuple[float, st
 # SELF-LEARNING ADAPTIVE WEIGHTS ENGINE
 # ==========================================================
 
-def learn_from_outcomes() -> Dict[str, float]:
+def _compute_adaptive_weights() -> Dict[str, float]:
     """
     Learns certification effectiveness from historical outcomes.
     Deterministic, bounded, zero-division safe.
     """
-    data = get_outcomes_data()
-    stats: Dict[str, Dict[str, int]] = {}
+    counts: Counter = Counter(
+        (
+            _norm(r.get("cert_type", "student_coordinator")),
+            _norm(r.get("placed", "no")) == "yes",
+        )
+        for r in get_outcomes_data()
+    )
 
-    for r in data:
-        cert = str(r.get("cert_type", "student_coordinator")).strip().lower()
-        placed = str(r.get("placed", "no")).strip().lower() == "yes"
+    adaptive_weights: Dict[str, float] = {}
+    for cert in {cert for cert, _ in counts}:
+        yes = counts[(cert, True)]
+        total = yes + counts[(cert, False)]
+        adaptive_weights[cert] = round(yes / total, 2) if total else 0.2
 
-        if cert not in stats:
-            stats[cert] = {"yes": 0, "no": 0}
+    return adaptive_weights
 
-        stats[cert]["yes" if placed else "no"] += 1
+adaptive_weights_cache = TTLCache(CACHE_TTL_SECONDS)
+CACHE_REFRESH_PLAN.append((adaptive_weights_cache, _compute_adaptive_weights))
 
-    adaptive_weights: Dict[str, float] = {}
-    for cert, s in stats.items():
-        total = s["yes"] + s["no"]
-        adaptive_weights[cert] = round(s["yes"] / total, 2) if total else 0.2
+def learn_from_outcomes() -> Dict[str, float]:
+    """
+    Cached adaptive weights.
+    Outcomes are scanned at most once per TTL window, not once per student.
+    """
+    return adaptive_weights_cache.get(_compute_adaptive_weights)
 
-    return adaptive_weights
+BASE_CERT_WEIGHTS = MappingProxyType({
+    "professional": 1.0,
+    "short_program": 0.7,
+    "workshop": 0.4,
+    "conference": 0.3,
+    "student_coordinator": 0.2,
+})
 
 def certificate_weight(cert_type: str) -> float:
     """
     Final weight resolver: adaptive first, fallback to base.
     """
     adaptive = learn_from_outcomes()
-    key = str(cert_type).strip().lower()
-
-    base = {
-        "professional": 1.0,
-        "short_program": 0.7,
-        "workshop": 0.4,
-        "conference": 0.3,
-        "student_coordinator": 0.2,
-    }
+    key = _norm(cert_type)
 
-    return adaptive.get(key, base.get(key, 0.2))
+    return adaptive.get(key, BASE_CERT_WEIGHTS.get(key, 0.2))
 
 # ==========================================================
 # CSI CORE ENGINE
@@ -435,6 +722,146 @@ def dropout_engine(
 def placement_probability_engine(csi: float, employability: float) -> float:
     return clamp((csi * 0.5 + employability * 0.5), 0, 100)
 
+# ==========================================================
+# VECTORIZED BATCH ENGINES (SoA)
+# ==========================================================
+
+def _per_key(values: np.ndarray, fn: Callable[[Any], float]) -> np.ndarray:
+    """
+    Evaluates fn once per distinct key and broadcasts back to every row.
+    Cert types / sources / branches only have a handful of distinct values.
+    """
+    table = {v: fn(v) for v in set(values.tolist())}
+    return np.array([table[v] for v in values.tolist()], dtype=np.float64)
+
+@njit(cache=True)
+def _score_row(att, avg, cred, adaptive, dom_weight):
+    """
+    Fused final_csi -> risk_timeline -> dropout_engine -> employability
+    -> placement -> intervention_priority for one student, returned in
+    _SCORE_COLUMNS order. Mirrors the scalar engines; only values that
+    feed later steps are rounded here, terminal columns are rounded once
+    in score_batch.
+    """
+    cert_score = adaptive * 10 * cred
+    csi = max(0.0, min(100.0, att * 0.4 + avg * 0.4 + cert_score))
+    csi = round(csi, 2)
+    cert_score = round(cert_score, 2)
+
+    cert_gap = 1.0 if cert_score <= 2 else 0.0
+    decay_rate = max(((75 - att) / 2 + (65 - avg) + cert_gap * 10) / 30, 0.5)
+    days_critical = max(0.0, min(120.0, (csi - 59) / decay_rate))
+    recovery_rate = 1 + cert_score * 0.3
+    days_save = max(0.0, min(90.0, (80 - csi) / recovery_rate))
+
+    drop = max(0.0, min(100.0, ((80 - csi) + (75 - att) + (65 - avg) + cert_gap * 20) / 2))
+    employability = round(max(0.0, min(100.0, csi * dom_weight)), 2)
+    placement = max(0.0, min(100.0, csi * 0.5 + employability * 0.5))
+
+    priority = 80 - csi
+    if cert_score < 7:
+        priority *= 2
+    if att < 70:
+        priority *= 1.5
+
+    return (
+        csi, cert_score, days_critical, days_save, drop,
+        employability, placement, max(priority, 0.0),
+    )
+
+@njit(cache=True)
+def _csi_kernel(
+    att, avg, cred, adaptive, dom_weight,
+    out_csi, out_cert, out_days_crit, out_days_save, out_drop,
+    out_emp, out_place, out_prio,
+):
+    """One compiled pass of _score_row over every student."""
+    for i in range(att.shape[0]):
+        (
+            out_csi[i], out_cert[i], out_days_crit[i], out_days_save[i],
+            out_drop[i], out_emp[i], out_place[i], out_prio[i],
+        ) = _score_row(att[i], avg[i], cred[i], adaptive[i], dom_weight[i])
+
+_SCORE_COLUMNS = (
+    "csi", "cert_score", "days_critical", "days_save", "dropout_prob",
+    "employability", "placement_prob", "priority",
+)
+
+# Columns the kernel leaves unrounded. score_batch must pass them through
+# _round_deferred before returning: urgency_batch, the /mentor_queue mask
+# and salary_time_estimator_batch read the rounded days_critical/priority,
+# so the rounding must never move after those consumers.
+_DEFERRED_ROUNDING = MappingProxyType({
+    "days_critical": 1,
+    "days_save": 1,
+    "dropout_prob": 2,
+    "priority": 2,
+})
+
+def _round_deferred(out: Dict[str, np.ndarray]) -> None:
+    """Round the _DEFERRED_ROUNDING columns of a kernel result in place."""
+    for key, decimals in _DEFERRED_ROUNDING.items():
+        np.round(out[key], decimals, out=out[key])
+
+# Compile (or load from the on-disk cache) at import, not on the first request.
+_csi_kernel(
+    np.zeros(1, dtype=np.int16), np.zeros(1, dtype=np.int16),
+    np.zeros(1), np.zeros(1), np.zeros(1),
+    *(np.empty(1) for _ in _SCORE_COLUMNS),
+)
+
+def score_batch(soa: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Array form of the CSI / risk / dropout / employability / placement /
+    priority engines over every student at once.
+    """
+    sources = soa["cert_source"].tolist()
+    credibility = {src: certificate_credibility("", src) for src in set(sources)}
+    cred_weight = np.array([credibility[src][0] for src in sources], dtype=np.float64)
+    cred_tag = np.array([credibility[src][1] for src in sources], dtype=object)
+
+    adaptive_factor = _per_key(soa["cert_type"], certificate_weight)
+    dom_weight = _per_key(soa["branch_key"], dominant_skill_weight)
+
+    n = len(soa["att"])
+    out = {key: np.empty(n, dtype=np.float64) for key in _SCORE_COLUMNS}
+
+    _csi_kernel(
+        soa["att"], soa["avg"], cred_weight, adaptive_factor, dom_weight,
+        *(out[key] for key in _SCORE_COLUMNS),
+    )
+    _round_deferred(out)
+    out["cred_tag"] = cred_tag
+    return out
+
+def urgency_batch(days_critical: np.ndarray) -> np.ndarray:
+    return np.select(
+        [days_critical < 30, days_critical < 60],
+        ["HIGH", "MEDIUM"],
+        default="LOW",
+    )
+
+CSI_STATUS_BOUNDS = (60, 80)
+CSI_STATUS = np.array(["Critical", "At Risk", "Stable"])
+
+def csi_status_index(csi: np.ndarray) -> np.ndarray:
+    """0 = Critical (<60), 1 = At Risk (60–79), 2 = Stable (>=80)."""
+    return np.digitize(csi, CSI_STATUS_BOUNDS)
+
+def csi_status_batch(status_idx: np.ndarray) -> np.ndarray:
+    return CSI_STATUS[status_idx]
+
+def csi_distribution(status_idx: np.ndarray) -> Dict[str, int]:
+    critical, at_risk, stable = np.bincount(status_idx, minlength=3).tolist()
+    return {"Stable": stable, "At Risk": at_risk, "Critical": critical}
+
+def salary_time_estimator_batch(priority_score: np.ndarray) -> np.ndarray:
+    return np.select(
+        [priority_score < 10, priority_score < 15],
+        ["2–3 months", "4–6 months"],
+        default="6–9 months",
+    )
+
 # ==========================================================
 # INCOME / SALARY TIMELINE ENGINE
 # ==========================================================
@@ -466,17 +893,17 @@ from typing import List, Dict, Any, Tuple
 # BRANCH ROADMAP ENGINE
 # ==========================================================
 
-def branch_roadmap(branch: str, reasons: List[str]) -> List[str]:
-    base_roadmaps = {
-        "cse": ["Python", "DSA", "SQL", "Git", "Internship"],
-        "aiml": ["Python", "ML", "DL", "SQL", "Internship"],
-        "ece": ["Embedded C", "IoT", "MATLAB"],
-        "mech": ["SolidWorks", "Manufacturing"],
-        "civil": ["AutoCAD", "ETABS", "STAAD"],
-        "eee": ["PLC", "SCADA", "MATLAB"],
-    }
+BASE_ROADMAPS = MappingProxyType({
+    "cse": ("Python", "DSA", "SQL", "Git", "Internship"),
+    "aiml": ("Python", "ML", "DL", "SQL", "Internship"),
+    "ece": ("Embedded C", "IoT", "MATLAB"),
+    "mech": ("SolidWorks", "Manufacturing"),
+    "civil": ("AutoCAD", "ETABS", "STAAD"),
+    "eee": ("PLC", "SCADA", "MATLAB"),
+})
 
-    roadmap = base_roadmaps.get(branch.lower(), ["Soft Skills", "Internship"]).copy()
+def branch_roadmap(branch_key: str, reasons: List[str]) -> List[str]:
+    roadmap = list(BASE_ROADMAPS.get(branch_key, ("Soft Skills", "Internship")))
 
     if "Low attendance" in reasons:
         roadmap.insert(0, "Attendance mentoring")
@@ -491,8 +918,29 @@ def branch_roadmap(branch: str, reasons: List[str]) -> List[str]:
 # SKILL INTELLIGENCE & EMPLOYABILITY ENGINE
 # ==========================================================
 
+SKILL_MAP = MappingProxyType({
+    "cse": ("Python", "DSA", "SQL", "Git", "Internship"),
+    "aiml": ("Python", "ML", "DL", "SQL", "Internship"),
+    "ece": ("Embedded C", "IoT", "MATLAB"),
+    "mech": ("SolidWorks", "Manufacturing"),
+    "civil": ("AutoCAD", "ETABS"),
+    "eee": ("PLC", "SCADA"),
+})
+
+SKILL_WEIGHTS = MappingProxyType({
+    "Python": 1.2,
+    "DSA": 1.4,
+    "ML": 1.3,
+    "DL": 1.2,
+    "SQL": 1.1,
+    "Internship": 1.5,
+    "Git": 1.0,
+    "Embedded C": 1.2,
+    "IoT": 1.1,
+})
+
 def skill_intelligence(
-    branch: str,
+    branch_key: str,
     cert_score: float,
     csi: float,
 ) -> Tuple[List[str], str, str, float]:
@@ -503,41 +951,26 @@ def skill_intelligence(
     - Survival / success path
     - Employability score
     """
-    skill_map = {
-        "cse": ["Python", "DSA", "SQL", "Git", "Internship"],
-        "aiml": ["Python", "ML", "DL", "SQL", "Internship"],
-        "ece": ["Embedded C", "IoT", "MATLAB"],
-        "mech": ["SolidWorks", "Manufacturing"],
-        "civil": ["AutoCAD", "ETABS"],
-        "eee": ["PLC", "SCADA"],
-    }
-
-    skill_weights = {
-        "Python": 1.2,
-        "DSA": 1.4,
-        "ML": 1.3,
-        "DL": 1.2,
-        "SQL": 1.1,
-        "Internship": 1.5,
-        "Git": 1.0,
-        "Embedded C": 1.2,
-        "IoT": 1.1,
-    }
-
-    skills = skill_map.get(branch.lower(), ["Soft Skills"])
+    skills = SKILL_MAP.get(branch_key, ("Soft Skills",))
     dominant_skill = skills[0]
 
     employability = clamp(
-        csi * skill_weights.get(dominant_skill, 1.0),
+        csi * SKILL_WEIGHTS.get(dominant_skill, 1.0),
         0,
         100,
     )
 
-    weak_skills = skills[2:] if cert_score > 4 else skills
+    weak_skills = list(skills[2:] if cert_score > 4 else skills)
     success_path = f"Can survive and grow via {dominant_skill}-centric roles"
 
     return weak_skills, dominant_skill, success_path, round(employability, 2)
 
+def dominant_skill_weight(branch_key: str) -> float:
+    """
+    Employability multiplier skill_intelligence applies for a branch.
+    """
+    return SKILL_WEIGHTS.get(SKILL_MAP.get(branch_key, ("Soft Skills",))[0], 1.0)
+
 # ==========================================================
 # DAILY RECOVERY PLANNER
 # ==========================================================
@@ -581,19 +1014,19 @@ def company_reality_mapper(
     employability: float,
 ) -> Dict[str, Any]:
     if dominant_skill == "Python":
-        companies = ["TCS", "Accenture", "Infosys", "Zoho"]
+        companies = ("TCS", "Accenture", "Infosys", "Zoho")
         salary = "₹4–7 LPA" if employability < 80 else "₹7–12 LPA"
-        blockers = ["DSA", "SQL", "Projects"] if employability < 80 else ["System Design"]
+        blockers = ("DSA", "SQL", "Projects") if employability < 80 else ("System Design",)
 
     elif dominant_skill in ("ML", "DL"):
-        companies = ["Fractal", "Tiger Analytics", "Mu Sigma"]
+        companies = ("Fractal", "Tiger Analytics", "Mu Sigma")
         salary = "₹6–10 LPA" if employability < 80 else "₹10–18 LPA"
-        blockers = ["Model deployment", "End-to-end projects"]
+        blockers = ("Model deployment", "End-to-end projects")
 
     else:
-        companies = ["Wipro", "HCL"]
+        companies = ("Wipro", "HCL")
         salary = "₹2–4 LPA"
-        blockers = ["Core skill depth"]
+        blockers = ("Core skill depth",)
 
     return {
         "target_companies": companies,
@@ -621,6 +1054,37 @@ def intervention_priority(
 
     return round(max(priority, 0), 2)
 
+# ==========================================================
+# STUDENT SCORES CACHE
+# ==========================================================
+
+def _compute_student_scores() -> Dict[str, Any]:
+    soa = students_soa(get_students_data())
+
+    scores = score_batch(soa)
+    csi = scores["csi"]
+    status_idx = csi_status_index(csi)
+
+    return {
+        **soa,
+        **scores,
+        "status": csi_status_batch(status_idx),
+        "urgency": urgency_batch(scores["days_critical"]),
+        "income_timeline": salary_time_estimator_batch(scores["priority"]),
+        "distribution": csi_distribution(status_idx),
+        "health_score": round(float(csi.mean()), 2) if len(csi) else 0,
+    }
+
+csi_cache = TTLCache(CACHE_TTL_SECONDS)
+CACHE_REFRESH_PLAN.append((csi_cache, _compute_student_scores))
+
+def get_student_scores() -> Dict[str, Any]:
+    """
+    SoA columns, every per-student score and the cohort aggregates,
+    computed once per TTL window and shared across endpoints.
+    """
+    return csi_cache.get(_compute_student_scores)
+
 # ==========================================================
 # END OF PART 3
 # ==========================================================
@@ -636,110 +1100,150 @@ Part 4/4: API endpoints and orchestration layer
 """
 
 from fastapi import HTTPException
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Awaitable, Callable, Iterator
+import re
 
 # ==========================================================
 # STUDENT INTELLIGENCE (FULL PIPELINE)
 # ==========================================================
 
+def _iter_student_intelligence(scores: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for (
+        s, branch_key, att, avg, csi, cert_score, status,
+        days_critical, days_save, dropout_prob, urgency,
+        employability, placement_prob, priority, income_timeline, cred_tag,
+    ) in zip(
+        scores["records"],
+        scores["branch_key"].tolist(),
+        scores["att"].tolist(),
+        scores["avg"].tolist(),
+        scores["csi"].tolist(),
+        scores["cert_score"].tolist(),
+        scores["status"].tolist(),
+        scores["days_critical"].tolist(),
+        scores["days_save"].tolist(),
+        scores["dropout_prob"].tolist(),
+        scores["urgency"].tolist(),
+        scores["employability"].tolist(),
+        scores["placement_prob"].tolist(),
+        scores["priority"].tolist(),
+        scores["income_timeline"].tolist(),
+        scores["cred_tag"].tolist(),
+    ):
+        branch = s.get("branch", "")
+
+        reasons = explain_csi(att, avg, cert_score)
+
+        roadmap = branch_roadmap(branch_key, reasons)
+        weak, dominant, path, _ = skill_intelligence(
+            branch_key,
+            cert_score,
+            csi,
+        )
+
+        daily_plan = daily_recovery_planner(
+            branch,
+            reasons,
+            days_save,
+            dominant,
+        )
+
+        company_map = company_reality_mapper(dominant, csi, employability)
+
+        yield {
+            "id": s.get("id", ""),
+            "name": s.get("name", ""),
+            "branch": branch,
+            "csi": csi,
+            "status": status,
+            "reasons": reasons,
+            "critical_in_days": days_critical,
+            "dropout_probability": dropout_prob,
+            "rescue_urgency": urgency,
+            "days_to_save": days_save,
+            "priority_score": priority,
+            "roadmap": roadmap,
+            "weak_skills": weak,
+            "dominant_skill": dominant,
+            "success_path": path,
+            "employability_score": employability,
+            "placement_probability": placement_prob,
+            "daily_recovery_plan": daily_plan,
+            "company_path": company_map,
+            "certificate_credibility": cred_tag,
+            "income_timeline": income_timeline,
+        }
+
+def _build_student_intelligence() -> List[Dict[str, Any]]:
+    return list(_iter_student_intelligence(get_student_scores()))
+
+def _encode_student_intelligence() -> bytes:
+    return orjson.dumps(_build_student_intelligence())
+
+intelligence_cache = TTLCache(CACHE_TTL_SECONDS)
+CACHE_REFRESH_PLAN.append((intelligence_cache, _encode_student_intelligence))
+
+def get_student_intelligence_payload() -> bytes:
+    """
+    Pre-serialized /student_intelligence body.
+    Built and encoded once per TTL window; hits skip both.
+    """
+    return intelligence_cache.get(_encode_student_intelligence)
+
 @app.get("/student_intelligence")
-def student_intelligence():
+async def student_intelligence():
     try:
-        students = get_students_data()
-        results: List[Dict[str, Any]] = []
-
-        for s in students:
-            att = safe_int(s.get("attendance"))
-            avg = safe_int(s.get("internal_avg"))
-
-            csi, cert_score = final_csi(s)
-            status = "Stable" if csi >= 80 else "At Risk" if csi >= 60 else "Critical"
-
-            reasons = explain_csi(att, avg, cert_score)
-            days_critical, days_save = risk_timeline(att, avg, cert_score, csi)
-            dropout_prob, urgency = dropout_engine(att, avg, cert_score, csi, days_critical)
-
-            roadmap = branch_roadmap(s.get("branch", ""), reasons)
-            weak, dominant, path, employability = skill_intelligence(
-                s.get("branch", ""),
-                cert_score,
-                csi,
-            )
-
-            daily_plan = daily_recovery_planner(
-                s.get("branch", ""),
-                reasons,
-                days_save,
-                dominant,
-            )
-
-            placement_prob = placement_probability_engine(csi, employability)
-            company_map = company_reality_mapper(dominant, csi, employability)
-
-            priority = intervention_priority(csi, cert_score, att)
-            _, cred_tag = certificate_credibility(
-                s.get("cert_type", ""),
-                s.get("cert_source", ""),
-            )
-
-            results.append({
-                "id": s.get("id", ""),
-                "name": s.get("name", ""),
-                "branch": s.get("branch", ""),
-                "csi": csi,
-                "status": status,
-                "reasons": reasons,
-                "critical_in_days": days_critical,
-                "dropout_probability": dropout_prob,
-                "rescue_urgency": urgency,
-                "days_to_save": days_save,
-                "priority_score": priority,
-                "roadmap": roadmap,
-                "weak_skills": weak,
-                "dominant_skill": dominant,
-                "success_path": path,
-                "employability_score": employability,
-                "placement_probability": placement_prob,
-                "daily_recovery_plan": daily_plan,
-                "company_path": company_map,
-                "certificate_credibility": cred_tag,
-                "income_timeline": salary_time_estimator(priority),
-            })
-
-        return results
+        payload = await load_cached(intelligence_cache, get_student_intelligence_payload)
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         logger.exception("student_intelligence failed")
         raise HTTPException(status_code=500, detail=str(e))
 
+NDJSON_CHUNK_ROWS = 256
+
+def _student_intelligence_ndjson(scores: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    One JSON object per line, flushed every NDJSON_CHUNK_ROWS rows.
+    Sync on purpose: Starlette pulls each chunk in the threadpool,
+    so row building never blocks the event loop.
+    """
+    chunk: List[bytes] = []
+    for row in _iter_student_intelligence(scores):
+        chunk.append(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+        if len(chunk) == NDJSON_CHUNK_ROWS:
+            yield b"".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield b"".join(chunk)
+
+@app.get("/student_intelligence/stream")
+async def student_intelligence_stream():
+    """
+    Same rows as /student_intelligence, streamed as NDJSON so clients
+    can start parsing before the whole cohort is built.
+    """
+    scores = await load_cached(csi_cache, get_student_scores)
+    return StreamingResponse(
+        _student_intelligence_ndjson(scores),
+        media_type="application/x-ndjson",
+    )
+
 # ==========================================================
 # KPI SUMMARY DASHBOARD
 # ==========================================================
 
 @app.get("/kpi_summary")
-def kpi_summary():
-    students = get_students_data()
-    total = len(students)
-
-    stable = at_risk = critical = 0
-    total_csi = 0.0
-
-    for s in students:
-        csi, _ = final_csi(s)
-        total_csi += csi
-        if csi >= 80:
-            stable += 1
-        elif csi >= 60:
-            at_risk += 1
-        else:
-            critical += 1
+async def kpi_summary():
+    scores = await load_cached(csi_cache, get_student_scores)
+    distribution = scores["distribution"]
 
     return {
-        "total_students": total,
-        "stable": stable,
-        "at_risk": at_risk,
-        "critical": critical,
-        "health_score": round(total_csi / total, 2) if total else 0,
+        "total_students": len(scores["csi"]),
+        "stable": distribution["Stable"],
+        "at_risk": distribution["At Risk"],
+        "critical": distribution["Critical"],
+        "health_score": scores["health_score"],
     }
 
 # ==========================================================
@@ -747,28 +1251,19 @@ def kpi_summary():
 # ==========================================================
 
 @app.get("/skill_demand")
-def skill_demand():
-    return get_skills_data()
+async def skill_demand():
+    return await load_cached(sheets_cache, get_skills_data)
 
 # ==========================================================
 # BATCH HEATMAP
 # ==========================================================
 
 @app.get("/batch_heatmap")
-def batch_heatmap():
-    students = get_students_data()
-    distribution = {"Stable": 0, "At Risk": 0, "Critical": 0}
-
-    for s in students:
-        csi, _ = final_csi(s)
-        if csi >= 80:
-            distribution["Stable"] += 1
-        elif csi >= 60:
-            distribution["At Risk"] += 1
-        else:
-            distribution["Critical"] += 1
-
-    total = len(students)
+async def batch_heatmap():
+    scores = await load_cached(csi_cache, get_student_scores)
+    distribution = dict(scores["distribution"])
+
+    total = len(scores["csi"])
     return {
         "total_students": total,
         "distribution": distribution,
@@ -782,28 +1277,29 @@ def batch_heatmap():
 # ==========================================================
 
 @app.get("/mentor_queue")
-def mentor_queue():
-    queue: List[Dict[str, Any]] = []
-
-    for s in get_students_data():
-        att = safe_int(s.get("attendance"))
-        avg = safe_int(s.get("internal_avg"))
-        csi, cert_score = final_csi(s)
-
-        days_critical, _ = risk_timeline(att, avg, cert_score, csi)
-        _, urgency = dropout_engine(att, avg, cert_score, csi, days_critical)
-
-        if urgency in ("HIGH", "MEDIUM"):
-            queue.append({
-                "name": s.get("name", ""),
-                "branch": s.get("branch", ""),
-                "urgency": urgency,
-                "action": (
-                    "Immediate 1-on-1 mentoring"
-                    if urgency == "HIGH"
-                    else "Group mentoring + certification plan"
-                ),
-            })
+async def mentor_queue():
+    scores = await load_cached(csi_cache, get_student_scores)
+
+    # HIGH / MEDIUM urgency == days_critical < 60; skip everyone else up front.
+    idx = np.flatnonzero(scores["days_critical"] < 60)
+
+    queue: List[Dict[str, Any]] = [
+        {
+            "name": name,
+            "branch": branch,
+            "urgency": urgency,
+            "action": (
+                "Immediate 1-on-1 mentoring"
+                if urgency == "HIGH"
+                else "Group mentoring + certification plan"
+            ),
+        }
+        for name, branch, urgency in zip(
+            scores["name"][idx].tolist(),
+            scores["branch"][idx].tolist(),
+            scores["urgency"][idx].tolist(),
+        )
+    ]
 
     return queue
 
@@ -811,20 +1307,38 @@ def mentor_queue():
 # STUDENT ASSISTANT AI (INTENT-BASED)
 # ==========================================================
 
+async def _intent_at_risk() -> Any:
+    scores = await load_cached(csi_cache, get_student_scores)
+    return scores["name"][scores["csi"] < 80].tolist()
+
+async def _intent_critical() -> Any:
+    scores = await load_cached(csi_cache, get_student_scores)
+    return scores["name"][scores["csi"] < 60].tolist()
+
+async def _intent_skills() -> Any:
+    return await load_cached(sheets_cache, get_skills_data)
+
+async def _intent_health() -> Any:
+    scores = await load_cached(csi_cache, get_student_scores)
+    return f"Institution Health Score is {scores['health_score']}"
+
+# Keyword -> handler, in precedence order when a question matches several.
+ASSISTANT_INTENTS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "at risk": _intent_at_risk,
+    "critical": _intent_critical,
+    "skills": _intent_skills,
+    "health": _intent_health,
+}
+INTENT_RE = re.compile("|".join(re.escape(k) for k in ASSISTANT_INTENTS))
+
 @app.post("/assistant")
-def assistant(query: Dict[str, str]):
+async def assistant(query: Dict[str, str]):
     q = query.get("question", "").lower()
-    students = get_students_data()
-
-    if "at risk" in q:
-        return {"reply": [s["name"] for s in students if final_csi(s)[0] < 80]}
-    if "critical" in q:
-        return {"reply": [s["name"] for s in students if final_csi(s)[0] < 60]}
-    if "skills" in q:
-        return {"reply": get_skills_data()}
-    if "health" in q:
-        avg = sum(final_csi(s)[0] for s in students) / len(students)
-        return {"reply": f"Institution Health Score is {round(avg, 2)}"}
+    found = set(INTENT_RE.findall(q))
+
+    for intent, handler in ASSISTANT_INTENTS.items():
+        if intent in found:
+            return {"reply": await handler()}
 
     return {"reply": "Ask about: at risk, critical, skills, health"}
 
@@ -832,17 +1346,20 @@ def assistant(query: Dict[str, str]):
 # OUTCOME FEEDBACK LOGGING
 # ==========================================================
 
+def _append_outcome(row: List[Any]) -> None:
+    with _SHEET_LOCK.write():
+        get_outcomes_worksheet().append_row(row)
+
 @app.post("/outcome_feedback")
-def outcome_feedback(data: Dict[str, Any]):
+async def outcome_feedback(data: Dict[str, Any]):
     try:
-        with _SHEET_LOCK:
-            outcomes_sheet.append_row([
-                data.get("id", ""),
-                data.get("cert_type", ""),
-                data.get("placed", ""),
-                data.get("salary", ""),
-                data.get("days", ""),
-            ])
+        await run_in_threadpool(_append_outcome, [
+            data.get("id", ""),
+            data.get("cert_type", ""),
+            data.get("placed", ""),
+            data.get("salary", ""),
+            data.get("days", ""),
+        ])
         return {"status": "Recorded"}
     except Exception as e:
         logger.exception("Outcome feedback failed")
@@ -871,20 +1388,33 @@ def self_learning_adjuster():
 # END OF PART 4 — SYSTEM COMPLETE (19/19)
 # ==========================================================
 def role_required(role: str):
-    def checker(user=Depends(get_current_user)):
+    async def checker(user=Depends(get_current_user)):
         if user.get("role") != role:
             raise HTTPException(status_code=403, detail="Access denied")
         return user
     return checker
 
 @app.get("/dashboard/student")
-def student_dashboard(user=Depends(role_required("student"))):
+async def student_dashboard(user=Depends(role_required("student"))):
     return {"message": f"Welcome student {user['sub']}"}
 
 @app.get("/dashboard/mentor")
-def mentor_dashboard(user=Depends(role_required("mentor"))):
+async def mentor_dashboard(user=Depends(role_required("mentor"))):
     return {"message": f"Welcome mentor {user['sub']}"}
 
 @app.get("/dashboard/institute")
-def institute_dashboard(user=Depends(role_required("institute"))):
+async def institute_dashboard(user=Depends(role_required("institute"))):
     return {"message": f"Welcome institute {user['sub']}"}
+
+@app.post("/cache/invalidate")
+def invalidate_cache(user=Depends(role_required("institute"))):
+    """
+    Reload every cache from Sheets now, e.g. right after editing the sheet,
+    instead of waiting for the background refresher.
+    """
+    try:
+        refresh_all_caches()
+        return {"status": "Refreshed", "caches": len(CACHE_REFRESH_PLAN)}
+    except Exception as e:
+        logger.exception("Cache invalidation failed")
+        raise HTTPException(status_code=500, detail=str(e))
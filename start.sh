@@ -1 +1 @@
-uvicorn main:app --host 0.0.0.0 --port 10000
+uvicorn main:app --host 0.0.0.0 --port 10000 --loop uvloop
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Parity check: the batch kernel behind every endpoint must agree with
+hand-computed rows and with the plain-Python scalar engines, which stay
+the reference implementation of every formula.
+
+Run offline with:  python -m unittest discover tests
+"""
+
+import os
+import random
+import unittest
+from unittest import mock
+
+os.environ.setdefault("EMPIRIA_SECRET", "test-secret")
+os.environ.setdefault("EMPIRIA_DB_NAME", "test-db")
+os.environ.setdefault("GOOGLE_CREDS_JSON", "{}")
+
+import main  # noqa: E402  (env must be set first)
+
+ROSTER_SIZE = 20_000
+ADAPTIVE_WEIGHTS = {"professional": 0.63, "workshop": 0.17, "conference": 0.5}
+
+def _random_roster(rng: random.Random):
+    return [
+        {
+            "id": i,
+            "name": f"student-{i}",
+            "branch": rng.choice(["CSE", "aiml", "ECE", "mech", "civil", "eee", "bio", ""]),
+            "attendance": rng.randint(0, 100),
+            "internal_avg": rng.randint(0, 100),
+            "cert_type": rng.choice([
+                "professional", "short_program", "workshop", "conference",
+                "student_coordinator", "unknown_type",
+            ]),
+            "cert_source": rng.choice([
+                "google", " AWS ", "nptel", "randomsite", "telegram", "other",
+            ]),
+        }
+        for i in range(ROSTER_SIZE)
+    ]
+
+# Worked by hand from the formulas, with ADAPTIVE_WEIGHTS in effect.
+EXPECTED_ROWS = [
+    (
+        {"branch": "CSE", "attendance": 90, "internal_avg": 80,
+         "cert_type": "professional", "cert_source": "google"},
+        {"csi": 74.3, "cert_score": 6.3, "days_critical": 30.6, "days_save": 2.0,
+         "dropout_prob": 0.0, "employability": 89.16, "placement_prob": 81.73,
+         "priority": 11.4, "urgency": "MEDIUM", "income": "4–6 months"},
+    ),
+    (
+        {"branch": "mech", "attendance": 50, "internal_avg": 40,
+         "cert_type": "workshop", "cert_source": "telegram"},
+        {"csi": 35.32, "cert_score": -0.68, "days_critical": 0.0, "days_save": 56.1,
+         "dropout_prob": 57.34, "employability": 35.32, "placement_prob": 35.32,
+         "priority": 134.04, "urgency": "HIGH", "income": "6–9 months"},
+    ),
+]
+
+class ScoreParityTest(unittest.TestCase):
+    def test_batch_matches_hand_computed_rows(self):
+        roster = [student for student, _ in EXPECTED_ROWS]
+
+        with mock.patch.object(main, "learn_from_outcomes", return_value=ADAPTIVE_WEIGHTS):
+            scores = main.score_batch(main.students_soa(roster))
+        scores["urgency"] = main.urgency_batch(scores["days_critical"])
+        scores["income"] = main.salary_time_estimator_batch(scores["priority"])
+
+        for i, (_, expected) in enumerate(EXPECTED_ROWS):
+            for column, value in expected.items():
+                actual = scores[column][i]
+                if isinstance(value, str):
+                    self.assertEqual(actual, value, f"row {i}: {column}")
+                else:
+                    self.assertAlmostEqual(actual, value, 9, f"row {i}: {column}")
+
+    def test_batch_matches_scalar_engines(self):
+        roster = _random_roster(random.Random(73))
+
+        with mock.patch.object(main, "learn_from_outcomes", return_value=ADAPTIVE_WEIGHTS):
+            soa = main.students_soa(roster)
+            scores = main.score_batch(soa)
+            urgency = main.urgency_batch(scores["days_critical"]).tolist()
+            income = main.salary_time_estimator_batch(scores["priority"]).tolist()
+
+            for i, s in enumerate(roster):
+                att, avg = s["attendance"], s["internal_avg"]
+
+                csi, cert_score = main.final_csi(s)
+                days_critical, days_save = main.risk_timeline(att, avg, cert_score, csi)
+                dropout, level = main.dropout_engine(att, avg, cert_score, csi, days_critical)
+                *_, employability = main.skill_intelligence(
+                    soa["branch_key"][i], cert_score, csi,
+                )
+                placement = main.placement_probability_engine(csi, employability)
+                priority = main.intervention_priority(csi, cert_score, att)
+
+                expected = {
+                    "csi": csi,
+                    "cert_score": cert_score,
+                    "days_critical": days_critical,
+                    "days_save": days_save,
+                    "dropout_prob": dropout,
+                    "employability": employability,
+                    "placement_prob": placement,
+                    "priority": priority,
+                }
+                for column, value in expected.items():
+                    self.assertEqual(scores[column][i], value, f"row {i}: {column}")
+
+                self.assertEqual(urgency[i], level, f"row {i}: urgency")
+                self.assertEqual(
+                    income[i], main.salary_time_estimator(priority), f"row {i}: income"
+                )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Ingest of raw sheet rows into the SoA columns the score kernel reads.
+
+Run offline with:  python -m unittest discover tests
+"""
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+os.environ.setdefault("EMPIRIA_SECRET", "test-secret")
+os.environ.setdefault("EMPIRIA_DB_NAME", "test-db")
+os.environ.setdefault("GOOGLE_CREDS_JSON", "{}")
+
+import main  # noqa: E402  (env must be set first)
+
+def _student(attendance, internal_avg):
+    return {
+        "id": 1,
+        "name": "student",
+        "branch": "CSE",
+        "attendance": attendance,
+        "internal_avg": internal_avg,
+        "cert_type": "professional",
+        "cert_source": "google",
+    }
+
+class StudentsSoaTest(unittest.TestCase):
+    def test_columns_follow_record_order(self):
+        roster = [
+            _student(91, 77),
+            {"name": "blank", "attendance": "", "internal_avg": "bad"},
+            _student("1e30", -10**20),
+            {**_student(60, 40), "branch": "AIML", "cert_source": " AWS "},
+        ]
+
+        soa = main.students_soa(roster)
+
+        self.assertIs(soa["records"], roster)
+        for column in ("att", "avg"):
+            self.assertEqual(soa[column].dtype, np.int16)
+        self.assertEqual(soa["att"].tolist(), [91, 0, 32767, 60])
+        self.assertEqual(soa["avg"].tolist(), [77, 0, -32768, 40])
+        self.assertEqual(
+            soa["cert_type"].tolist(),
+            ["professional", "student_coordinator", "professional", "professional"],
+        )
+        self.assertEqual(
+            soa["cert_source"].tolist(), ["google", "unknown", "google", "aws"]
+        )
+        self.assertEqual(soa["branch"].tolist(), ["CSE", "", "CSE", "AIML"])
+        self.assertEqual(soa["branch_key"].tolist(), ["cse", "", "cse", "aiml"])
+        self.assertEqual(soa["name"].tolist(), ["student", "blank", "student", "student"])
+
+class OutOfRangeCellsTest(unittest.TestCase):
+    def test_out_of_range_cells_are_clamped_and_scored(self):
+        roster = [
+            _student("1e30", 50),
+            _student(10**20, 50),
+            _student(-10**20, 50),
+            _student(80, "1e30"),
+            _student(-1e30, -1e30),
+        ]
+
+        with mock.patch.object(main, "learn_from_outcomes", return_value={}):
+            soa = main.students_soa(roster)
+            scores = main.score_batch(soa)
+
+        self.assertEqual(
+            soa["att"].tolist(), [32767, 32767, -32768, 80, -32768]
+        )
+        self.assertEqual(soa["avg"].tolist(), [50, 50, 50, 32767, -32768])
+
+        self.assertEqual(scores["csi"].tolist(), [100.0, 100.0, 0.0, 100.0, 0.0])
+        self.assertEqual(scores["dropout_prob"].tolist(), [0.0, 0.0, 100.0, 0.0, 100.0])
+        self.assertEqual(scores["days_critical"].tolist()[:2], [82.0, 82.0])
+        self.assertEqual(scores["priority"].tolist(), [0.0, 0.0, 120.0, 0.0, 120.0])
+
+if __name__ == "__main__":
+    unittest.main()